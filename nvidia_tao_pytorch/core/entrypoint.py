@@ -37,6 +37,11 @@ LIGHTNING_EXCLUDED_NETWORKS = [
     "pointpillars",
 ]
 
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Parsed experiment specs keyed on (path, mtime_ns).
+_YAML_CACHE = {}
+
 
 def get_subtasks(package):
     """Get supported subtasks for a given task.
@@ -72,6 +77,22 @@ def get_subtasks(package):
     return modules
 
 
+def load_experiment_spec(spec_file):
+    """Load an experiment spec file, reusing the parse while the file is unchanged.
+
+    Args:
+        spec_file (str): Path to the experiment spec file.
+
+    Returns:
+        exp_config (dict): Parsed contents of the spec file.
+    """
+    key = (os.path.realpath(spec_file), os.stat(spec_file).st_mtime_ns)
+    if key not in _YAML_CACHE:
+        with open(spec_file, "r") as spec:
+            _YAML_CACHE[key] = yaml.load(spec, Loader=_YAML_LOADER)
+    return _YAML_CACHE[key]
+
+
 def command_line_parser(parser, subtasks):
     """Construct parser for CLI arguments"""
     parser.add_argument(
@@ -181,15 +202,14 @@ def launch(args, unknown_args, subtasks, network=None):
                 task = "train"
             else:
                 task = args["subtask"]
-            with open(args["experiment_spec_file"], "r") as spec:
-                exp_config = yaml.safe_load(spec)
-                if task in exp_config:
-                    if "num_gpus" in exp_config[task]:
-                        num_gpus = exp_config[task]["num_gpus"]
-                    if "gpu_ids" in exp_config[task]:
-                        gpu_ids = exp_config[task]["gpu_ids"]
-                    if "num_nodes" in exp_config[task]:
-                        num_nodes = exp_config[task]["num_nodes"]
+            exp_config = load_experiment_spec(args["experiment_spec_file"])
+            if task in exp_config:
+                if "num_gpus" in exp_config[task]:
+                    num_gpus = exp_config[task]["num_gpus"]
+                if "gpu_ids" in exp_config[task]:
+                    gpu_ids = exp_config[task]["gpu_ids"]
+                if "num_nodes" in exp_config[task]:
+                    num_nodes = exp_config[task]["num_nodes"]
 
     if num_gpus != len(gpu_ids):
         logging.warning(f"Number of gpus {num_gpus} != len({gpu_ids}).")
@@ -24,15 +24,17 @@ from nvidia_tao_pytorch.config.types import (
     LIST_FIELD,
     STR_FIELD,
 )
-from nvidia_tao_pytorch.cv.grounding_dino.model.swin_transformer import swin_model_dict
+from nvidia_tao_pytorch.cv.grounding_dino.model.swin_model_names import SWIN_MODEL_NAMES
 
-SUPPORTED_BACKBONES = [
-    *list(swin_model_dict.keys()),
-    *["resnet_50"],
-]
+SUPPORTED_BACKBONES = frozenset(SWIN_MODEL_NAMES) | {"resnet_50"}
 
+# Option strings for the `valid_options` metadata, joined once at import.
+_SUPPORTED_BACKBONES_STR = ",".join(sorted(SUPPORTED_BACKBONES))
+_TWO_STAGE_OPTS = "standard,no"
+_DECODER_SA_OPTS = "sa,ca_label,ca_content"
 
-@dataclass
+
+@dataclass(slots=True)
 class GDINOModelConfig:
     """Grounding DINO model config."""
 
@@ -48,7 +50,7 @@ class GDINOModelConfig:
         display_name="backbone",
         description="""The backbone name of the model.
                     TAO implementation of DINO support Swin and ResNet50.""",
-        valid_options=",".join(SUPPORTED_BACKBONES),
+        valid_options=_SUPPORTED_BACKBONES_STR,
         popular="yes",
     )
     num_queries: int = INT_FIELD(
@@ -157,10 +159,7 @@ class GDINOModelConfig:
     two_stage_type: str = STR_FIELD(
         value="standard",
         default_value="standard",
-        valid_options=",".join([
-            "standard",
-            "no"
-        ]),
+        valid_options=_TWO_STAGE_OPTS,
         description="Type of two stage in DINO",
         display_name="two stage type"
     )
@@ -168,7 +167,7 @@ class GDINOModelConfig:
         value="sa",
         default_value="sa",
         description="Type of decoder self attention.",
-        valid_options=",".join(['sa', 'ca_label', 'ca_content']),
+        valid_options=_DECODER_SA_OPTS,
         display_name="decoder self-attention type"
     )
     embed_init_tgt: bool = BOOL_FIELD(
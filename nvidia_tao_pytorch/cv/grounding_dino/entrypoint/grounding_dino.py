@@ -15,13 +15,37 @@
 """'Entry point' script running subtasks related to Grounding DINO."""
 
 import argparse
-import nvidia_tao_pytorch.cv.grounding_dino.scripts as scripts
-from nvidia_tao_pytorch.core.entrypoint import get_subtasks, launch, command_line_parser
+import functools
+import importlib.util
+import os
 
+from nvidia_tao_pytorch.core.entrypoint import launch, command_line_parser
 
+# Subtask name -> dotted module path of its runner script. Kept static so that
+# dispatching a subtask (or printing `--help`) doesn't import every script.
+SUBTASK_MODULES = {
+    "evaluate": "nvidia_tao_pytorch.cv.grounding_dino.scripts.evaluate",
+    "export": "nvidia_tao_pytorch.cv.grounding_dino.scripts.export",
+    "inference": "nvidia_tao_pytorch.cv.grounding_dino.scripts.inference",
+    "train": "nvidia_tao_pytorch.cv.grounding_dino.scripts.train",
+}
+
+
+@functools.lru_cache(maxsize=1)
 def get_subtask_list():
-    """Return the list of subtasks by inspecting the scripts package."""
-    return get_subtasks(scripts)
+    """Return the list of subtasks without importing the scripts.
+
+    The runner path of each subtask is resolved from its module spec, so the
+    script modules (and their heavy dependencies) are only loaded by the
+    subprocess that `launch` spawns for the selected subtask.
+    """
+    return {
+        task: {
+            "module_name": module_name,
+            "runner_path": os.path.abspath(importlib.util.find_spec(module_name).origin),
+        }
+        for task, module_name in SUBTASK_MODULES.items()
+    }
 
 
 def main():
@@ -0,0 +1,27 @@
+# Copyright (c) 2024, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Names of the Swin Transformer backbones supported by Grounding DINO.
+
+Kept free of heavy imports so that config modules can list the supported
+backbones without loading the model code.
+"""
+
+SWIN_MODEL_NAMES = (
+    "swin_tiny_224_1k",
+    "swin_base_224_22k",
+    "swin_base_384_22k",
+    "swin_large_224_22k",
+    "swin_large_384_22k",
+)
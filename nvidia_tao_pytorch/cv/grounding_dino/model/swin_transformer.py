@@ -23,6 +23,7 @@ from timm.models.layers import DropPath, to_2tuple, trunc_normal_
 
 from nvidia_tao_pytorch.cv.backbone.vision_transformer import Mlp
 from nvidia_tao_pytorch.cv.backbone.swin_utils import (window_partition, WindowAttention)
+from nvidia_tao_pytorch.cv.grounding_dino.model.swin_model_names import SWIN_MODEL_NAMES
 
 
 def window_reverse(windows, window_size, H, W, B):
@@ -658,3 +659,4 @@ swin_model_dict = {
     'swin_large_224_22k': swin_large_224_22k,
     'swin_large_384_22k': swin_large_384_22k,
 }
+assert tuple(swin_model_dict) == SWIN_MODEL_NAMES, "swin_model_dict is out of sync with SWIN_MODEL_NAMES."